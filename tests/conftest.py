@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def app():
+    """app.py imported once in Streamlit bare mode (widgets return defaults)"""
+    import app as app_module
+    return app_module
+
+
+@pytest.fixture
+def local_client(app):
+    """Client with no API configured, so every call takes the local path"""
+    client = app.VVIAPIClient()
+    assert not client.use_api
+    return client
@@ -0,0 +1,109 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+
+class _FakeAPI:
+    """Local HTTP server whose status code and body the test controls"""
+
+    def __init__(self):
+        self.status = 200
+        self.body = b""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(fake.status)
+                self.send_header("Content-Length", str(len(fake.body)))
+                self.end_headers()
+                self.wfile.write(fake.body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def respond(self, status, body=b""):
+        self.status, self.body = status, body
+
+
+@pytest.fixture
+def fake_api():
+    api = _FakeAPI()
+    yield api
+    api.server.shutdown()
+
+
+@pytest.fixture
+def client(app, fake_api):
+    client = app.VVIAPIClient(api_url=fake_api.url, api_key="test-key")
+    client._breaker.reset_timeout = 0.0  # every call after opening is a half-open probe
+    return client
+
+
+ASSESS_ARGS = ("C1", "2024-01", 120000.0, 850, 68000.0)
+
+
+def _api_result(app, local_client):
+    result = local_client._assess_local(app.AssessRequest(*ASSESS_ARGS))
+    return json.dumps(result).encode()
+
+
+def test_api_success(app, client, fake_api, local_client):
+    fake_api.respond(200, _api_result(app, local_client))
+    assert client.assess(*ASSESS_ARGS)["source"] == "api"
+
+
+def test_non_json_body_falls_back_and_counts_as_failure(app, client, fake_api):
+    fake_api.respond(200, b"<html>Bad gateway</html>")
+    result = client.assess(*ASSESS_ARGS)
+    assert result["source"] == "local" and "scores" in result
+    assert client._breaker.failure_count == 1
+
+
+def test_client_error_is_raised_not_masked(client, fake_api):
+    import requests
+
+    fake_api.respond(401)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.assess(*ASSESS_ARGS)
+    assert client._breaker.failure_count == 0
+
+
+def test_breaker_recovers_after_bad_probe(app, client, fake_api, local_client):
+    breaker = client._breaker
+    fake_api.respond(200, b"not json")
+    for _ in range(breaker.threshold):
+        client.assess(*ASSESS_ARGS)
+    assert breaker.state == breaker.OPEN
+
+    # Half-open probe with a garbage body re-opens instead of sticking in flight
+    assert client.assess(*ASSESS_ARGS)["source"] == "local"
+    assert breaker.state == breaker.OPEN and not breaker._probe_in_flight
+
+    fake_api.respond(200, _api_result(app, local_client))
+    assert client.assess(*ASSESS_ARGS)["source"] == "api"
+    assert breaker.state == breaker.CLOSED
+
+
+def test_unexpected_error_releases_probe(app, client, fake_api, local_client, monkeypatch):
+    breaker = client._breaker
+    breaker.state, breaker.opened_at = breaker.OPEN, 0.0
+
+    def boom(req):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(type(client), "_assess_via_api", lambda self, req: boom(req))
+    with pytest.raises(RuntimeError):
+        client.assess(*ASSESS_ARGS)
+    assert not breaker._probe_in_flight
+
+    monkeypatch.undo()
+    fake_api.respond(200, _api_result(app, local_client))
+    assert client.assess(*ASSESS_ARGS)["source"] == "api"
+    assert breaker.state == breaker.CLOSED
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _clinics(n=500, seed=7):
+    """Random clinics spread across all 16 scenarios, plus invalid rows"""
+    rng = np.random.default_rng(seed)
+    visits = rng.integers(100, 2000, n)
+    frame = pd.DataFrame({
+        "clinic_id": [f"C{i}" for i in range(n)],
+        "net_revenue": np.round(visits * 140.0 * rng.uniform(0.8, 1.15, n), 2),
+        "visit_volume": visits,
+        "labor_cost": np.round(visits * 85.0 * rng.uniform(0.85, 1.25, n), 2),
+    })
+    invalid = pd.DataFrame({
+        "clinic_id": ["Z1", "Z2", "Z3", "Z4", "Z5"],
+        "net_revenue": [0.0, 120000.0, 120000.0, -5000.0, 120000.0],
+        "visit_volume": [850, 0, 850, 850, -3],
+        "labor_cost": [68000.0, 68000.0, 0.0, 68000.0, 68000.0],
+    })
+    return pd.concat([frame, invalid], ignore_index=True)
+
+
+def _assert_matches_scalar(batch, scalar):
+    """Equal except calculated_at; rounded values may differ by one unit on exact ties"""
+    if "error" in scalar:
+        assert batch == scalar
+        return
+    for section, places in (("metrics", None), ("scores", 1)):
+        for key, value in scalar[section].items():
+            unit = 10.0 ** -(places or (1 if key == "swb_pct" else 2))
+            assert batch[section][key] == pytest.approx(value, abs=unit + 1e-9)
+    strip = {"calculated_at", "metrics", "scores"}
+    assert {k: v for k, v in batch.items() if k not in strip} == \
+        {k: v for k, v in scalar.items() if k not in strip}
+
+
+@pytest.mark.parametrize("include_actions", [False, True])
+def test_batch_results_match_scalar_path(app, local_client, include_actions):
+    frame = _clinics()
+    batch = app.assess_local_batch_results(frame, "2024-01", include_actions=include_actions)
+    assert len(batch) == len(frame)
+    for row, result in zip(frame.itertuples(index=False), batch):
+        req = app.AssessRequest(
+            row.clinic_id, "2024-01", float(row.net_revenue), int(row.visit_volume),
+            float(row.labor_cost), include_actions=include_actions,
+        )
+        _assert_matches_scalar(result, local_client._assess_local(req))
+    assert sum("error" in r for r in batch) == 5
+
+
+def test_batch_results_do_not_share_scenario_detail(app):
+    frame = _clinics(n=2)
+    first = app.assess_local_batch_results(frame.head(1), "2024-01", include_actions=True)[0]
+    first["actions"]["do_tomorrow"] = ("mutated",)
+    again = app.assess_local_batch_results(frame.head(1), "2024-01", include_actions=True)[0]
+    assert again["actions"]["do_tomorrow"] != ("mutated",)
+
+
+def test_tier_index_arrays_match_scalar(app):
+    scores = np.array([0.0, 89.99, 90.0, 94.9, 95.0, 99.99, 100.0, 250.0, np.nan])
+    expected = [app.tier_index(float(s)) for s in scores]
+    assert app.tier_index(scores).tolist() == expected
+    assert expected == [3, 3, 2, 2, 1, 1, 0, 0, 3]
+
+
+def test_batch_frame_matches_scalar_scores_and_tiers(app, local_client):
+    frame = _clinics()
+    # Exact tier boundaries: RF of 100/95/90 and LF of 100
+    boundary = pd.DataFrame({
+        "clinic_id": ["B1", "B2", "B3"],
+        "net_revenue": [140000.0, 133000.0, 126000.0],
+        "visit_volume": [1000, 1000, 1000],
+        "labor_cost": [85000.0, 85000.0, 85000.0],
+    })
+    frame = pd.concat([frame, boundary], ignore_index=True)
+    scored = app.assess_local_batch(frame)
+
+    for row, batch in zip(frame.itertuples(index=False), scored.itertuples(index=False)):
+        req = app.AssessRequest(
+            row.clinic_id, "2024-01", float(row.net_revenue), int(row.visit_volume),
+            float(row.labor_cost), include_actions=False,
+        )
+        scalar = local_client._assess_local(req)
+        if "error" in scalar:
+            assert not batch.valid and np.isnan(batch.vvi)
+            continue
+        assert batch.valid
+        assert (batch.vvi_tier, batch.rf_tier, batch.lf_tier) == tuple(scalar["tiers"].values())
+        assert batch.scenario_id == scalar["scenario"]["id"]
+        assert round(batch.rf, 1) == scalar["scores"]["rf"]
+
+    assert scored.tail(3)["rf_tier"].tolist() == ["Excellent", "Stable", "At Risk"]
@@ -0,0 +1,43 @@
+def test_result_detail_is_not_shared_with_scenario_cache(app, local_client):
+    req = app.AssessRequest("C1", "2024-01", 120000.0, 850, 68000.0)
+    first = local_client._assess_local(req)
+    scenario_id = first["scenario"]["id"]
+    original_actions = tuple(app.load_scenario(scenario_id)["actions"]["do_tomorrow"])
+
+    first["actions"]["do_tomorrow"] = ("mutated",)
+    first["expected_impact"]["timeline"] = "mutated"
+
+    second = local_client._assess_local(req)
+    assert tuple(second["actions"]["do_tomorrow"]) == original_actions
+    assert second["expected_impact"]["timeline"] != "mutated"
+    assert tuple(app.load_scenario(scenario_id)["actions"]["do_tomorrow"]) == original_actions
+
+
+def test_invalid_inputs_return_sentinel(app, local_client):
+    for net_revenue, visits, labor in ((0.0, 10, 500.0), (1000.0, 0, 500.0), (-1000.0, 10, 500.0)):
+        req = app.AssessRequest("C1", "2024-01", net_revenue, visits, labor)
+        assert local_client._assess_local(req) == {"source": "local", "error": "invalid_inputs"}
+
+
+def test_cached_scenario_is_read_only_throughout(app):
+    import pytest
+
+    scenario = app.load_scenario("S01")
+    with pytest.raises(TypeError):
+        scenario["name"] = "mutated"
+    with pytest.raises(TypeError):
+        scenario["actions"]["do_tomorrow"] = ("mutated",)
+    with pytest.raises(TypeError):
+        scenario["expected_impact"]["timeline"] = "mutated"
+    assert isinstance(scenario["actions"]["do_tomorrow"], tuple)
+    with pytest.raises(TypeError):
+        app.load_scenario_index()["S01"]["name"] = "mutated"
+
+
+def test_full_result_is_json_and_pickle_safe(app, local_client):
+    import pickle
+
+    result = local_client._assess_local(app.AssessRequest("C1", "2024-01", 120000.0, 850, 68000.0))
+    assert type(result["actions"]) is dict and type(result["expected_impact"]) is dict
+    assert app.json_loads(app.json_dumps_pretty(result))["actions"]
+    assert pickle.loads(pickle.dumps(result)) == result
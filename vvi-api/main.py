@@ -5,7 +5,7 @@ Production-ready API for Visit Value Index calculations and scenario classificat
 
 from fastapi import FastAPI, HTTPException, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
@@ -58,6 +58,7 @@ app = FastAPI(
     version=settings.API_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson encodes responses in C
 )
 
 # CORS middleware
@@ -251,28 +252,30 @@ class VVICalculator:
         else:
             return TierEnum.CRITICAL
     
+    # RF/LF tier pair -> scenario ID (static, built once at class creation)
+    SCENARIO_MAP = {
+        (TierEnum.EXCELLENT, TierEnum.EXCELLENT): "S01",
+        (TierEnum.EXCELLENT, TierEnum.STABLE): "S02",
+        (TierEnum.EXCELLENT, TierEnum.AT_RISK): "S03",
+        (TierEnum.EXCELLENT, TierEnum.CRITICAL): "S04",
+        (TierEnum.STABLE, TierEnum.EXCELLENT): "S05",
+        (TierEnum.STABLE, TierEnum.STABLE): "S06",
+        (TierEnum.STABLE, TierEnum.AT_RISK): "S07",
+        (TierEnum.STABLE, TierEnum.CRITICAL): "S08",
+        (TierEnum.AT_RISK, TierEnum.EXCELLENT): "S09",
+        (TierEnum.AT_RISK, TierEnum.STABLE): "S10",
+        (TierEnum.AT_RISK, TierEnum.AT_RISK): "S11",
+        (TierEnum.AT_RISK, TierEnum.CRITICAL): "S12",
+        (TierEnum.CRITICAL, TierEnum.EXCELLENT): "S13",
+        (TierEnum.CRITICAL, TierEnum.STABLE): "S14",
+        (TierEnum.CRITICAL, TierEnum.AT_RISK): "S15",
+        (TierEnum.CRITICAL, TierEnum.CRITICAL): "S16",
+    }
+    
     @staticmethod
     def get_scenario_id(rf_tier: TierEnum, lf_tier: TierEnum) -> str:
         """Map RF/LF tiers to scenario ID"""
-        scenario_map = {
-            (TierEnum.EXCELLENT, TierEnum.EXCELLENT): "S01",
-            (TierEnum.EXCELLENT, TierEnum.STABLE): "S02",
-            (TierEnum.EXCELLENT, TierEnum.AT_RISK): "S03",
-            (TierEnum.EXCELLENT, TierEnum.CRITICAL): "S04",
-            (TierEnum.STABLE, TierEnum.EXCELLENT): "S05",
-            (TierEnum.STABLE, TierEnum.STABLE): "S06",
-            (TierEnum.STABLE, TierEnum.AT_RISK): "S07",
-            (TierEnum.STABLE, TierEnum.CRITICAL): "S08",
-            (TierEnum.AT_RISK, TierEnum.EXCELLENT): "S09",
-            (TierEnum.AT_RISK, TierEnum.STABLE): "S10",
-            (TierEnum.AT_RISK, TierEnum.AT_RISK): "S11",
-            (TierEnum.AT_RISK, TierEnum.CRITICAL): "S12",
-            (TierEnum.CRITICAL, TierEnum.EXCELLENT): "S13",
-            (TierEnum.CRITICAL, TierEnum.STABLE): "S14",
-            (TierEnum.CRITICAL, TierEnum.AT_RISK): "S15",
-            (TierEnum.CRITICAL, TierEnum.CRITICAL): "S16",
-        }
-        return scenario_map.get((rf_tier, lf_tier), "S16")
+        return VVICalculator.SCENARIO_MAP.get((rf_tier, lf_tier), "S16")
 
 # ============================================================================
 # Scenario Data (Static Library)
@@ -358,6 +361,24 @@ SCENARIO_LIBRARY = {
     # Add remaining scenarios S02-S15 here (truncated for brevity)
 }
 
+@lru_cache(maxsize=None)
+def get_scenario_models(scenario_id: str):
+    """
+    Validated (Scenario, Actions, ExpectedImpact) models for a scenario ID.
+    The library is static, so each ID is validated once and the models are
+    reused by every response (read-only - never mutate them).
+    """
+    scenario_data = SCENARIO_LIBRARY.get(scenario_id, SCENARIO_LIBRARY["S16"])
+    scenario = Scenario(
+        id=scenario_id,
+        name=scenario_data["name"],
+        risk_level=scenario_data["risk_level"],
+        focus_areas=scenario_data["focus_areas"]
+    )
+    actions = Actions(**scenario_data["actions"])
+    expected_impact = ExpectedImpact(**scenario_data["expected_impact"])
+    return scenario, actions, expected_impact
+
 # ============================================================================
 # Security & Authentication
 # ============================================================================
@@ -440,7 +461,7 @@ async def assess_vvi(request: AssessmentRequest):
         
         # Step 4: Get scenario
         scenario_id = VVICalculator.get_scenario_id(rf_tier, lf_tier)
-        scenario_data = SCENARIO_LIBRARY.get(scenario_id, SCENARIO_LIBRARY["S16"])
+        scenario, actions, expected_impact = get_scenario_models(scenario_id)
         
         # Step 5: Build response
         response = AssessmentResponse(
@@ -450,18 +471,13 @@ async def assess_vvi(request: AssessmentRequest):
             metrics=CalculatedMetrics(**calc_metrics),
             scores=Scores(**scores),
             tiers=Tiers(vvi=vvi_tier, rf=rf_tier, lf=lf_tier),
-            scenario=Scenario(
-                id=scenario_id,
-                name=scenario_data["name"],
-                risk_level=scenario_data["risk_level"],
-                focus_areas=scenario_data["focus_areas"]
-            )
+            scenario=scenario
         )
         
         # Include actions if requested
         if request.options.get("include_actions", True):
-            response.actions = Actions(**scenario_data["actions"])
-            response.expected_impact = ExpectedImpact(**scenario_data["expected_impact"])
+            response.actions = actions
+            response.expected_impact = expected_impact
         
         logger.info(f"VVI assessment completed for {request.clinic_id} - Scenario: {scenario_id}")
         